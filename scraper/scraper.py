@@ -1,28 +1,167 @@
 #!/usr/bin/env python3
+import functools
 import json
+import os
 import requests
 import re
-from datetime import datetime
+import socket
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from html import escape
 from pathlib import Path
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Page patterns are bytes: the body is scanned undecoded and only the captured group is decoded
+_HLS_RE = re.compile(rb'"hlsManifestUrl":"([^"]+)"')
+_VIDEO_ID_RE = re.compile(rb'"videoId":"([^"]+)"')
+_EMBED_ID_RE = re.compile(r'/embed/([a-zA-Z0-9_-]+)')
+_WATCH_ID_RE = re.compile(r'[?&]v=([^&#]+)')
+
+# Longest match we expect to straddle two chunks (HLS manifest URLs run ~1-2 KB)
+_SCAN_OVERLAP = 8192
+
+# Real watch/live pages are hundreds of KB; anything this small is a stub
+_MIN_PAGE_BYTES = 1024
+
+_YOUTUBE_HOST = 'www.youtube.com'
+
+_LOGO_BASE = 'https://hecker723626.github.io/tv-streams/logos/'
+
+_DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent / 'public'
+
+# Opt-in (--hls-cache): resolved HLS manifests survive between local reruns;
+# YouTube also stamps its own expiry into the URL
+_HLS_CACHE_PATH = Path(__file__).resolve().parent / '.hls_cache.json'
+_HLS_CACHE_TTL = 5 * 60 * 60
+_HLS_EXPIRE_RE = re.compile(r'/expire/(\d+)')
+
+# Every text field is escaped by the caller: HTML-escaped, except initials, which are URL-quoted
+_CHANNEL_CARD_HTML = '''
+                <div class="channel-card" data-channel-index="{index}">
+                    <img src="{logo}" class="channel-logo" alt="{name}" 
+                         onerror="this.src='https://via.placeholder.com/100x100/667eea/ffffff?text={initials}'">
+                    <h3>{name}</h3>
+                    <span class="badge">{num_sources} source{plural}</span>
+                </div>'''
+
+def _utc_timestamp():
+    """Current UTC time as a second-precision ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def _json_bytes(obj, indent=False):
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=asdict).encode('utf-8')
+
+def _write_atomic(path, chunks):
+    """Stream byte chunks to a temp file and swap it in, so readers never see a partial file"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, path)
+
+def _encode_chunks(parts):
+    """Encode text chunks lazily so a whole document is never held as one string"""
+    for part in parts:
+        yield part.encode('utf-8')
+
+def _install_dns_cache():
+    """Memoize getaddrinfo so each host is resolved once per run"""
+    if not hasattr(socket.getaddrinfo, 'cache_info'):
+        socket.getaddrinfo = functools.lru_cache(maxsize=64)(socket.getaddrinfo)
+
+@dataclass(slots=True)
+class Stream:
+    """A scraped channel as published in the playlist, JSON API and web player"""
+    id: str
+    name: str
+    logo: str
+    genre: str
+    url: str
+    source_type: str
+    sources: dict
+    updated_at: str
+
 class StreamScraper:
-    def __init__(self, channels_config):
+    def __init__(self, channels_config, max_workers=20, youtube_concurrency=8, output_dir=None,
+                 hls_cache_path=None):
         self.channels = channels_config['channels']
         self.genres = channels_config.get('genres', {})
         self.streams = []
-        self.output_dir = Path('../public')
-        self.output_dir.mkdir(exist_ok=True)
+        self.run_timestamp = None
+        self.max_workers = max_workers
+        self._m3u8_cache = {}
+        self._m3u8_lock = threading.Lock()
+        self.youtube_concurrency = youtube_concurrency
+        self.hls_cache_path = Path(hls_cache_path) if hls_cache_path else None
+        self._hls_cache = self._load_hls_cache()
+        self.session = self._build_session()
+        self._warm_dns(_YOUTUBE_HOST)
+        # Anchor to the repo, not the CWD, so local and CI runs write the same place
+        self.output_dir = Path(output_dir or _DEFAULT_OUTPUT_DIR).resolve()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._m3u8_path = self.output_dir / 'playlist.m3u8'
+        self._json_path = self.output_dir / 'streams.json'
+        self._html_path = self.output_dir / 'index.html'
     
-    def get_logo_url(self, logo_filename):
+    def _build_session(self):
+        """Create a pooled HTTP session shared by all fetches"""
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            # Short, bounded retries: transient blips recover without stretching the run
+            max_retries=Retry(
+                total=2,
+                connect=2,
+                read=1,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504, 520, 522],
+                allowed_methods={'GET'}
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _warm_dns(self, host):
+        """Resolve host up front so worker threads start from a warm DNS cache"""
+        _install_dns_cache()
+        try:
+            # Same arguments urllib3 uses, so its lookups hit this cache entry
+            socket.getaddrinfo(host, 443, allowed_gai_family(), socket.SOCK_STREAM)
+        except OSError as e:
+            print(f"DNS warm-up failed for {host}: {e}")
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def get_logo_url(logo_filename):
         """Convert logo filename to full URL"""
         if logo_filename.startswith('http'):
             return logo_filename
         
-        encoded = quote(logo_filename)
-        return f"https://hecker723626.github.io/tv-streams/logos/{encoded}"
+        return _LOGO_BASE + quote(logo_filename)
     
-    def detect_source_type(self, url):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def detect_source_type(url):
         """Auto-detect source type from URL"""
         if not url:
             return 'unknown'
@@ -34,6 +173,7 @@ class StreamScraper:
                 return 'youtube_live'
             elif '/embed/' in url_lower or '/watch' in url_lower:
                 return 'youtube_embed'
+            return 'iframe'
         elif 'mcaster.tv' in url_lower:
             return 'mcaster_iframe'
         elif 'stmify.com' in url_lower or 'cdn.stmify.com' in url_lower:
@@ -43,27 +183,148 @@ class StreamScraper:
         else:
             return 'iframe'
     
+    def _scan_youtube_page(self, video_url, want_video_id=False):
+        """Stream a YouTube page, stopping as soon as the HLS manifest appears"""
+        hls_url = None
+        video_id = None
+        
+        with self.session.get(video_url, timeout=(3.05, 8), stream=True) as response:
+            # Error pages and redirect stubs never carry a manifest, so don't scan them
+            if response.status_code != 200:
+                print(f"YouTube HTTP {response.status_code}: {video_url}")
+                return None, None
+            
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) < _MIN_PAGE_BYTES:
+                return None, None
+            
+            # Carry only a short tail forward so each byte is scanned about once
+            tail = b''
+            for chunk in response.iter_content(chunk_size=65536):
+                window = tail + chunk
+                
+                if want_video_id and video_id is None:
+                    vid_match = _VIDEO_ID_RE.search(window)
+                    if vid_match:
+                        video_id = vid_match.group(1).decode('utf-8')
+                
+                hls_match = _HLS_RE.search(window)
+                if hls_match:
+                    hls_url = hls_match.group(1).decode('utf-8')
+                    break
+                
+                tail = window[-_SCAN_OVERLAP:]
+        
+        return hls_url, video_id
+    
+    def _video_id_from_url(self, video_url):
+        """Read the video id straight from a watch or embed URL"""
+        if '/watch' in video_url:
+            match = _WATCH_ID_RE.search(video_url)
+        elif '/embed/' in video_url:
+            match = _EMBED_ID_RE.search(video_url)
+        else:
+            return None
+        
+        return match.group(1) if match else None
+    
     def extract_youtube_m3u8(self, video_url):
-        """Extract M3U8 from YouTube URL"""
+        """Extract M3U8 from YouTube URL, fetching each video at most once per run"""
+        # Channels mirroring the same video share one fetch, even when scraped concurrently
+        video_id = self._video_id_from_url(video_url)
+        cache_key = video_id or video_url
+        with self._m3u8_lock:
+            pending = self._m3u8_cache.get(cache_key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self._m3u8_cache[cache_key] = Future()
+        
+        if is_owner:
+            # Always settle the Future, or other callers on this key block forever
+            # Only video ids go to disk: a live channel URL resolves to whatever is airing now
+            persist = self.hls_cache_path is not None and video_id is not None
+            try:
+                result = self._cached_hls(cache_key) if persist else None
+                if result is None:
+                    result = self._fetch_youtube_m3u8(video_url)
+                    if persist and result and self._extracted_type(result) == 'direct_m3u8':
+                        self._hls_cache[cache_key] = {'url': result, 'fetched_at': time.time()}
+            except BaseException as e:
+                pending.set_exception(e)
+                raise
+            pending.set_result(result)
+        return pending.result()
+    
+    @staticmethod
+    def _extracted_type(url):
+        """Type of an extract_youtube_m3u8 result: an HLS manifest or an embed fallback"""
+        return 'youtube_embed' if '/embed/' in url else 'direct_m3u8'
+    
+    def _load_hls_cache(self):
+        """Load HLS manifests resolved by earlier runs"""
+        if not self.hls_cache_path:
+            return {}
+        
         try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(video_url, headers=headers, timeout=10)
-            
-            pattern = r'"hlsManifestUrl":"([^"]+)"'
-            match = re.search(pattern, response.text)
+            with open(self.hls_cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable HLS cache: {e}")
+            return {}
+        
+        if not isinstance(data, dict):
+            print("⚠️  Ignoring malformed HLS cache")
+            return {}
+        
+        # Drop entries that don't look like what _save_hls_cache writes
+        return {key: entry for key, entry in data.items() if self._is_valid_entry(entry)}
+    
+    @staticmethod
+    def _is_valid_entry(entry):
+        """Check an HLS cache entry has a str url and a numeric fetched_at"""
+        if not isinstance(entry, dict) or not isinstance(entry.get('url'), str):
+            return False
+        fetched_at = entry.get('fetched_at')
+        return isinstance(fetched_at, (int, float)) and not isinstance(fetched_at, bool)
+    
+    def _save_hls_cache(self):
+        """Persist fresh HLS cache entries for the next run"""
+        if not self.hls_cache_path:
+            return
+        
+        fresh = {key: entry for key, entry in self._hls_cache.items() if self._is_fresh(entry)}
+        _write_atomic(self.hls_cache_path, [_json_bytes(fresh)])
+    
+    def _is_fresh(self, entry):
+        """Check a cache entry against both our TTL and the manifest's own expiry"""
+        now = time.time()
+        if now - entry['fetched_at'] >= _HLS_CACHE_TTL:
+            return False
+        
+        expire_match = _HLS_EXPIRE_RE.search(entry['url'])
+        return not expire_match or int(expire_match.group(1)) > now
+    
+    def _cached_hls(self, cache_key):
+        """Return a still-valid HLS URL from an earlier run, if any"""
+        entry = self._hls_cache.get(cache_key)
+        if entry and self._is_fresh(entry):
+            return entry['url']
+        return None
+    
+    def _fetch_youtube_m3u8(self, video_url):
+        """Fetch a YouTube page and pull out its M3U8 or embed URL"""
+        try:
+            is_live_channel = '/channel/' in video_url and '/live' in video_url
+            hls_url, live_video_id = self._scan_youtube_page(video_url, want_video_id=is_live_channel)
             
-            if match:
-                return match.group(1).replace('\\u0026', '&')
+            if hls_url:
+                return hls_url.replace('\\u0026', '&')
             
-            video_id = None
-            if '/watch?v=' in video_url:
-                video_id = video_url.split('v=')[1].split('&')[0]
-            elif '/embed/' in video_url:
-                video_id = video_url.split('/embed/')[1].split('?')[0]
-            elif '/channel/' in video_url and '/live' in video_url:
-                vid_match = re.search(r'"videoId":"([^"]+)"', response.text)
-                if vid_match:
-                    video_id = vid_match.group(1)
+            video_id = self._video_id_from_url(video_url)
+            if not video_id and is_live_channel:
+                video_id = live_video_id
             
             if video_id:
                 return f"https://www.youtube.com/embed/{video_id}"
@@ -73,147 +334,170 @@ class StreamScraper:
             print(f"YouTube error: {e}")
             return None
     
-    def process_source(self, source_url):
-        """Process a source URL and return playable URL"""
-        if not source_url:
-            return None
-        
+    def _normalize_url(self, source_url):
+        """Give scheme-less source URLs an https:// scheme"""
         if source_url.startswith('//'):
-            source_url = 'https:' + source_url
+            return 'https:' + source_url
         elif not source_url.startswith('http'):
-            source_url = 'https://' + source_url
+            return 'https://' + source_url
+        return source_url
+    
+    def process_source(self, source_url):
+        """Process a source URL and return (playable URL, source type)"""
+        if not source_url:
+            return None, 'unknown'
         
+        source_url = self._normalize_url(source_url)
         source_type = self.detect_source_type(source_url)
         
         if source_type in ['youtube_live', 'youtube_embed']:
             processed = self.extract_youtube_m3u8(source_url)
-            return processed if processed else source_url
+            if processed:
+                return processed, self._extracted_type(processed)
         
-        return source_url
+        return source_url, source_type
+    
+    def _youtube_sources(self):
+        """Collect the unique YouTube source URLs that need a page fetch"""
+        urls = {}
+        for channel in self.channels:
+            for src_url in channel.get('sources', {}).values():
+                if not src_url:
+                    continue
+                
+                src_url = self._normalize_url(src_url)
+                if self.detect_source_type(src_url) in ['youtube_live', 'youtube_embed']:
+                    urls[src_url] = None
+        return list(urls)
+    
+    def scrape_channel(self, channel):
+        """Scrape a single channel, returning (stream, status)"""
+        name = channel.get('name', 'Unknown')
+        
+        sources_dict = channel.get('sources', {})
+        if not sources_dict:
+            return None, "❌ (no sources)"
+        
+        processed_sources = {}
+        for src_key, src_url in sources_dict.items():
+            processed_url, source_type = self.process_source(src_url)
+            if processed_url:
+                processed_sources[src_key] = {
+                    'url': processed_url,
+                    'type': source_type
+                }
+        
+        if not processed_sources:
+            return None, "❌ (all sources failed)"
+        
+        first_source = list(processed_sources.values())[0]
+        
+        stream = Stream(
+            id=channel.get('id', name.lower().replace(' ', '-')),
+            name=name,
+            logo=self.get_logo_url(channel.get('logo', 'placeholder.png')),
+            genre=channel.get('genre', 'entertainment'),
+            url=first_source['url'],
+            source_type=first_source['type'],
+            sources=processed_sources,
+            updated_at=self.run_timestamp
+        )
+        return stream, f"✅ ({len(processed_sources)} sources)"
     
     def scrape_all(self):
-        """Scrape all channels"""
+        """Scrape all channels, fetching YouTube pages concurrently"""
+        # Every stream from one run shares the same timestamp
+        self.run_timestamp = _utc_timestamp()
+        
         print("🔍 Starting stream scraping...")
         print(f"📊 Total channels: {len(self.channels)}\n")
         
         success_count = 0
         fail_count = 0
         
+        # Only YouTube sources touch the network: resolve each unique one in parallel
+        # up front, so the per-channel pass below is served from the m3u8 cache
+        youtube_urls = self._youtube_sources()
+        print(f"🌐 Resolving {len(youtube_urls)} YouTube sources...\n")
+        # Every task here is a YouTube fetch, so the pool size is the YouTube concurrency cap
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, self.youtube_concurrency)) as executor:
+            list(executor.map(self.extract_youtube_m3u8, youtube_urls))
+        
         for idx, channel in enumerate(self.channels, 1):
             name = channel.get('name', 'Unknown')
             print(f"[{idx}/{len(self.channels)}] {name}...", end=' ')
             
-            sources_dict = channel.get('sources', {})
-            if not sources_dict:
-                print("❌ (no sources)")
-                fail_count += 1
-                continue
-            
-            processed_sources = {}
-            for src_key, src_url in sources_dict.items():
-                processed_url = self.process_source(src_url)
-                if processed_url:
-                    processed_sources[src_key] = {
-                        'url': processed_url,
-                        'type': self.detect_source_type(processed_url)
-                    }
+            stream, status = self.scrape_channel(channel)
+            print(status)
             
-            if processed_sources:
-                first_source = list(processed_sources.values())[0]
-                
-                self.streams.append({
-                    'id': channel.get('id', name.lower().replace(' ', '-')),
-                    'name': name,
-                    'logo': self.get_logo_url(channel.get('logo', 'placeholder.png')),
-                    'genre': channel.get('genre', 'entertainment'),
-                    'url': first_source['url'],
-                    'source_type': first_source['type'],
-                    'sources': processed_sources,
-                    'updated_at': datetime.utcnow().isoformat()
-                })
-                print(f"✅ ({len(processed_sources)} sources)")
+            if stream:
+                self.streams.append(stream)
                 success_count += 1
             else:
-                print("❌ (all sources failed)")
                 fail_count += 1
         
+        self.session.close()
+        self._save_hls_cache()
+        
         print(f"\n📈 Results: {success_count} successful, {fail_count} failed")
         return self.streams
     
     def generate_m3u8(self):
         """Generate M3U8 playlist"""
-        m3u8_content = "#EXTM3U\n"
+        return ''.join(self._iter_m3u8())
+    
+    def _iter_m3u8(self):
+        """Yield the M3U8 playlist one entry at a time"""
+        yield "#EXTM3U\n"
         
         for stream in self.streams:
-            genre_name = self.genres.get(stream['genre'], {}).get('name', stream['genre'].title())
-            m3u8_content += f'#EXTINF:-1 tvg-id="{stream["id"]}" '
-            m3u8_content += f'tvg-name="{stream["name"]}" '
-            m3u8_content += f'tvg-logo="{stream["logo"]}" '
-            m3u8_content += f'group-title="{genre_name}",{stream["name"]}\n'
-            m3u8_content += f'{stream["url"]}\n'
-        
-        return m3u8_content
+            genre_name = self.genres.get(stream.genre, {}).get('name', stream.genre.title())
+            yield (
+                f'#EXTINF:-1 tvg-id="{stream.id}" tvg-name="{stream.name}" '
+                f'tvg-logo="{stream.logo}" group-title="{genre_name}",{stream.name}\n'
+                f'{stream.url}\n'
+            )
     
     def save_outputs(self):
         """Save all output files"""
-        m3u8_path = self.output_dir / 'playlist.m3u8'
-        with open(m3u8_path, 'w', encoding='utf-8') as f:
-            f.write(self.generate_m3u8())
-        
-        json_path = self.output_dir / 'streams.json'
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'last_updated': datetime.utcnow().isoformat(),
-                'total_streams': len(self.streams),
-                'genres': self.genres,
-                'streams': self.streams
-            }, f, indent=2, ensure_ascii=False)
-        
-        html_path = self.output_dir / 'index.html'
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(self.generate_index_html())
+        _write_atomic(self._m3u8_path, _encode_chunks(self._iter_m3u8()))
+        
+        _write_atomic(self._json_path, [_json_bytes({
+            'last_updated': self.run_timestamp or _utc_timestamp(),
+            'total_streams': len(self.streams),
+            'genres': self.genres,
+            'streams': self.streams
+        }, indent=True)])
+        
+        _write_atomic(self._html_path, _encode_chunks(self._iter_index_html()))
         
         print(f"\n✅ Generated {len(self.streams)} streams")
-        print(f"📁 Saved to: {self.output_dir.absolute()}")
+        print(f"📁 Saved to: {self.output_dir}")
 
     def generate_index_html(self):
         """Generate modern web player interface with FIXED source switching"""
-        by_genre = {}
-        for stream in self.streams:
-            genre = stream['genre']
-            if genre not in by_genre:
-                by_genre[genre] = []
-            by_genre[genre].append(stream)
-        
-        tabs_html = ''
-        content_html = ''
-        
+        return ''.join(self._iter_index_html())
+    
+    def _iter_index_html(self):
+        """Yield the index page in pieces so it can be streamed to disk"""
+        # Cards carry only their index into the single window.__CHANNELS payload
+        by_genre = defaultdict(list)
+        for index, stream in enumerate(self.streams):
+            by_genre[stream.genre].append((index, stream))
+        
+        tab_parts = []
         for idx, (genre, channels) in enumerate(by_genre.items()):
             active = 'active' if idx == 0 else ''
             genre_info = self.genres.get(genre, {'name': genre.title(), 'icon': '📺'})
             
-            tabs_html += f'''
-            <button class="tab-btn {active}" data-genre="{genre}">
-                {genre_info["icon"]} {genre_info["name"]} ({len(channels)})
-            </button>'''
-            
-            content_html += f'<div class="genre-content {active}" data-genre="{genre}">'
-            content_html += '<div class="channel-grid">'
-            
-            for ch in channels:
-                num_sources = len(ch.get('sources', {}))
-                
-                content_html += f'''
-                <div class="channel-card" data-channel='{json.dumps(ch, ensure_ascii=False)}'>
-                    <img src="{ch['logo']}" class="channel-logo" alt="{ch['name']}" 
-                         onerror="this.src='https://via.placeholder.com/100x100/667eea/ffffff?text={ch['name'][:2]}'">
-                    <h3>{ch['name']}</h3>
-                    <span class="badge">{num_sources} source{'s' if num_sources > 1 else ''}</span>
-                </div>'''
-            
-            content_html += '</div></div>'
+            tab_parts.append(f'''
+            <button class="tab-btn {active}" data-genre="{escape(genre)}">
+                {genre_info["icon"]} {escape(genre_info["name"])} ({len(channels)})
+            </button>''')
+        
+        tabs_html = ''.join(tab_parts)
         
-        return f'''<!DOCTYPE html>
+        yield f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -324,14 +608,34 @@ class StreamScraper:
         <header>
             <h1>📺 Live TV Streams</h1>
             <div class="stats">
-                <p>Last Updated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}</p>
+                <p>Last Updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}</p>
                 <p><strong>{len(self.streams)}</strong> Channels • Updates Every 6 Hours</p>
                 <p><a href="/playlist.m3u8">📥 M3U8</a> | <a href="/streams.json">🔗 JSON API</a></p>
             </div>
         </header>
         
         <div class="tabs">{tabs_html}</div>
-        {content_html}
+        '''
+        
+        for idx, (genre, channels) in enumerate(by_genre.items()):
+            active = 'active' if idx == 0 else ''
+            yield f'<div class="genre-content {active}" data-genre="{escape(genre)}">'
+            yield '<div class="channel-grid">'
+            
+            for index, ch in channels:
+                num_sources = len(ch.sources)
+                yield _CHANNEL_CARD_HTML.format(
+                    index=index,
+                    logo=escape(ch.logo),
+                    name=escape(ch.name),
+                    initials=quote(ch.name[:2]),
+                    num_sources=num_sources,
+                    plural='s' if num_sources > 1 else ''
+                )
+            
+            yield '</div></div>'
+        
+        yield f'''
         
         <footer><p>🔄 Automatic updates every 6 hours</p></footer>
     </div>
@@ -350,7 +654,13 @@ class StreamScraper:
         </div>
     </div>
     
-    <script>
+    '''
+        
+        # Escape "</" so a channel field can never close the script element early
+        channels_json = _json_bytes(self.streams).decode('utf-8').replace('</', '<\\/')
+        yield f'<script>window.__CHANNELS = {channels_json};</script>\n'
+        
+        yield f'''    <script>
         let currentChannel = null;
         let currentSourceKey = null;
         
@@ -368,7 +678,7 @@ class StreamScraper:
         // Channel card click
         document.querySelectorAll('.channel-card').forEach(card => {{
             card.onclick = () => {{
-                currentChannel = JSON.parse(card.dataset.channel);
+                currentChannel = window.__CHANNELS[card.dataset.channelIndex];
                 openPlayer(currentChannel);
             }};
         }});
@@ -497,6 +807,7 @@ if __name__ == '__main__':
         print("❌ channels.json not found!")
         exit(1)
     
-    scraper = StreamScraper(config)
+    hls_cache_path = _HLS_CACHE_PATH if '--hls-cache' in sys.argv[1:] else None
+    scraper = StreamScraper(config, hls_cache_path=hls_cache_path)
     scraper.scrape_all()
     scraper.save_outputs()
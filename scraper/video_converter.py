@@ -6,229 +6,141 @@ Converts Telegram video links to embeddable URLs for static hosting
 
 import json
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
-class TelegramVideoConverter:
-    """Convert Telegram video links to embeddable format"""
-    
-    def __init__(self, output_dir='../public'):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        self.anime_data = []
-        self.movie_data = []
-    
-    def convert_telegram_link(self, tg_link: str) -> Optional[Dict[str, str]]:
-        """
-        Convert Telegram link to usable video URL
-        Supports:
-        - t.me/channel/post
-        - t.me/c/channel/post
-        - Direct video file links
-        """
-        if not tg_link:
-            return None
-        
-        # Clean the link
-        tg_link = tg_link.strip()
-        
-        # Pattern matching for different Telegram link formats
-        patterns = [
-            r't\.me/([^/]+)/(\d+)',           # t.me/channel/123
-            r't\.me/c/(\d+)/(\d+)',           # t.me/c/123456/789
-            r'telegram\.me/([^/]+)/(\d+)',    # telegram.me/channel/123
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, tg_link)
-            if match:
-                channel = match.group(1)
-                post_id = match.group(2)
-                
-                # Generate embed URL using various Telegram embed services
-                return {
-                    'original': tg_link,
-                    'embed_url': f"https://t.me/{channel}/{post_id}?embed=1&mode=tme",
-                    'preview_url': f"https://t.me/{channel}/{post_id}",
-                    'type': 'telegram_embed'
-                }
-        
-        # If it's already a direct video link
-        if tg_link.startswith('http') and any(ext in tg_link.lower() for ext in ['.mp4', '.mkv', '.avi']):
-            return {
-                'original': tg_link,
-                'embed_url': tg_link,
-                'preview_url': tg_link,
-                'type': 'direct_video'
-            }
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# t.me/channel/123, t.me/c/123456/789 and telegram.me/channel/123 in one pass
+_TG_RE = re.compile(r'(?:t\.me|telegram\.me)/((?:c/)?[^/]+)/(\d+)')
+
+# Direct video file extension at the end of the path (before any query/fragment)
+_EXT_RE = re.compile(r'\.(?:mp4|mkv|avi)(?:[?#]|$)', re.I)
+
+# Fields an entry must carry before it is accepted
+_ANIME_REQUIRED = frozenset(('id', 'name', 'type'))
+_MOVIE_REQUIRED = frozenset(('id', 'name', 'type', 'telegram_link'))
+
+
+def _telegram_urls(tg_link: str, channel: str, post_id: str) -> Tuple[str, str, str, str]:
+    """Build the conversion tuple for a matched Telegram post"""
+    # Generate embed URL using various Telegram embed services; the preview
+    # URL is built once and reused as the embed prefix
+    preview_url = 'https://t.me/' + channel + '/' + post_id
+    return (tg_link, preview_url + '?embed=1&mode=tme', preview_url, 'telegram_embed')
+
+
+@lru_cache(maxsize=8192)
+def _convert_link(tg_link: str) -> Optional[Tuple[str, str, str, str]]:
+    """Resolve a stripped link to (original, embed_url, preview_url, type)"""
+    # Cheap substring test first; most non-Telegram links never hit the regex
+    match = None
+    if 't.me/' in tg_link or 'telegram.me/' in tg_link:
+        match = _TG_RE.search(tg_link)
+    if match:
+        channel = match.group(1)
+        post_id = match.group(2)
         
-        return None
-    
-    def add_anime(self, anime_data: Dict) -> bool:
-        """
-        Add anime entry
-        Expected format:
-        {
-            "id": "one-piece",
-            "name": "One Piece",
-            "image": "https://...",
-            "genre": ["Action", "Adventure"],
-            "description": "...",
-            "type": "series",
-            "episodes": [
-                {
-                    "number": 1,
-                    "title": "Episode 1",
-                    "telegram_link": "t.me/channel/123"
-                }
-            ],
-            "related": {
-                "previous_season": null,
-                "next_season": "one-piece-2"
-            }
-        }
-        """
-        try:
-            # Validate required fields
-            required = ['id', 'name', 'type']
-            if not all(field in anime_data for field in required):
-                print(f"❌ Missing required fields: {required}")
-                return False
-            
-            # Convert Telegram links for episodes
-            if anime_data.get('type') == 'series' and 'episodes' in anime_data:
-                for episode in anime_data['episodes']:
-                    if 'telegram_link' in episode:
-                        converted = self.convert_telegram_link(episode['telegram_link'])
-                        if converted:
-                            episode['video_url'] = converted['embed_url']
-                            episode['video_type'] = converted['type']
-            elif anime_data.get('type') == 'standalone' and 'telegram_link' in anime_data:
-                converted = self.convert_telegram_link(anime_data['telegram_link'])
-                if converted:
-                    anime_data['video_url'] = converted['embed_url']
-                    anime_data['video_type'] = converted['type']
-            
-            anime_data['updated_at'] = datetime.utcnow().isoformat()
-            self.anime_data.append(anime_data)
-            print(f"✅ Added anime: {anime_data['name']}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error adding anime: {e}")
-            return False
-    
-    def add_movie(self, movie_data: Dict) -> bool:
-        """
-        Add movie entry
-        Expected format:
-        {
-            "id": "inception",
-            "name": "Inception",
-            "image": "https://...",
-            "genre": ["Sci-Fi", "Thriller"],
-            "description": "...",
-            "type": "standalone",
-            "telegram_link": "t.me/channel/456"
-        }
-        """
-        try:
-            required = ['id', 'name', 'type', 'telegram_link']
-            if not all(field in movie_data for field in required):
-                print(f"❌ Missing required fields: {required}")
-                return False
-            
-            # Convert Telegram link
-            converted = self.convert_telegram_link(movie_data['telegram_link'])
-            if converted:
-                movie_data['video_url'] = converted['embed_url']
-                movie_data['video_type'] = converted['type']
-            else:
-                print(f"⚠️  Could not convert Telegram link for {movie_data['name']}")
-            
-            movie_data['updated_at'] = datetime.utcnow().isoformat()
-            self.movie_data.append(movie_data)
-            print(f"✅ Added movie: {movie_data['name']}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error adding movie: {e}")
-            return False
+        return _telegram_urls(tg_link, channel, post_id)
     
-    def load_from_json(self, anime_file: str = None, movie_file: str = None):
-        """Load existing anime and movie data from JSON files"""
-        if anime_file and Path(anime_file).exists():
-            with open(anime_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for anime in data.get('anime', []):
-                    self.add_anime(anime)
-        
-        if movie_file and Path(movie_file).exists():
-            with open(movie_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for movie in data.get('movies', []):
-                    self.add_movie(movie)
+    # If it's already a direct video link
+    if tg_link.startswith('http') and _EXT_RE.search(tg_link):
+        return (tg_link, tg_link, tg_link, 'direct_video')
     
-    def save_outputs(self):
-        """Save anime and movie JSON files"""
-        # Save anime.json
-        anime_path = self.output_dir / 'anime.json'
-        with open(anime_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'last_updated': datetime.utcnow().isoformat(),
-                'total_anime': len(self.anime_data),
-                'anime': self.anime_data
-            }, f, indent=2, ensure_ascii=False)
-        
-        # Save movies.json
-        movies_path = self.output_dir / 'movies.json'
-        with open(movies_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'last_updated': datetime.utcnow().isoformat(),
-                'total_movies': len(self.movie_data),
-                'movies': self.movie_data
-            }, f, indent=2, ensure_ascii=False)
-        
-        # Generate web interface
-        self.generate_web_interface()
-        
-        print(f"\n✅ Saved {len(self.anime_data)} anime and {len(self.movie_data)} movies")
-        print(f"📁 Output directory: {self.output_dir.absolute()}")
+    return None
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(path: str):
+    """Parse a JSON file from raw bytes, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _intern_tags(entry: Dict):
+    """Share one string object per distinct type/genre value across entries"""
+    if isinstance(entry.get('type'), str):
+        entry['type'] = sys.intern(entry['type'])
+    genres = entry.get('genre')
+    if isinstance(genres, list):
+        entry['genre'] = [sys.intern(g) if isinstance(g, str) else g for g in genres]
+
+
+def _to_columns(entries: List[Dict]) -> Dict[str, object]:
+    """
+    Transpose entries into one column per key so each key is written once
+    A key present in every entry becomes a list; otherwise a sparse
+    {index: value} map, so absent keys stay absent and explicit nulls survive
+    """
+    columns = {}
+    for key in dict.fromkeys(key for entry in entries for key in entry):
+        if all(key in entry for entry in entries):
+            columns[key] = [entry[key] for entry in entries]
+        else:
+            columns[key] = {str(idx): entry[key] for idx, entry in enumerate(entries) if key in entry}
+    return columns
+
+
+def _from_columns(columns) -> List[Dict]:
+    """Rebuild entries from _to_columns output"""
+    if isinstance(columns, list):
+        return columns  # files written before the columnar layout
     
-    def generate_web_interface(self):
-        """Generate modern web interface for anime and movies"""
-        html_content = f'''<!DOCTYPE html>
+    entries = {}
+    for key, cells in (columns or {}).items():
+        pairs = cells.items() if isinstance(cells, dict) else enumerate(cells)
+        for idx, value in pairs:
+            entries.setdefault(int(idx), {})[key] = value
+    return [entries[idx] for idx in sorted(entries)]
+
+
+# Static video library page; it loads anime.json/movies.json at runtime
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Anime & Movies - Video Library</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #7e22ce 100%);
             color: white;
             min-height: 100vh;
-        }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
-        header {{
+        }
+        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
+        header {
             text-align: center;
             margin-bottom: 40px;
             padding: 30px 0;
             background: rgba(0,0,0,0.3);
             border-radius: 20px;
-        }}
-        h1 {{ font-size: 3rem; margin-bottom: 10px; text-shadow: 2px 2px 4px rgba(0,0,0,0.5); }}
-        .tabs {{
+        }
+        h1 { font-size: 3rem; margin-bottom: 10px; text-shadow: 2px 2px 4px rgba(0,0,0,0.5); }
+        .tabs {
             display: flex;
             gap: 10px;
             margin-bottom: 30px;
             justify-content: center;
             flex-wrap: wrap;
-        }}
-        .tab-btn {{
+        }
+        .tab-btn {
             background: rgba(255,255,255,0.2);
             border: 2px solid rgba(255,255,255,0.3);
             padding: 15px 30px;
@@ -238,19 +150,19 @@ class TelegramVideoConverter:
             font-size: 1.1rem;
             font-weight: 600;
             transition: all 0.3s;
-        }}
-        .tab-btn:hover {{ background: rgba(255,255,255,0.3); transform: translateY(-2px); }}
-        .tab-btn.active {{ background: rgba(255,255,255,0.4); box-shadow: 0 5px 15px rgba(0,0,0,0.3); }}
+        }
+        .tab-btn:hover { background: rgba(255,255,255,0.3); transform: translateY(-2px); }
+        .tab-btn.active { background: rgba(255,255,255,0.4); box-shadow: 0 5px 15px rgba(0,0,0,0.3); }
         
-        .content {{ display: none; }}
-        .content.active {{ display: block; }}
+        .content { display: none; }
+        .content.active { display: block; }
         
-        .grid {{
+        .grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
             gap: 25px;
-        }}
-        .card {{
+        }
+        .card {
             background: rgba(255,255,255,0.1);
             border-radius: 15px;
             overflow: hidden;
@@ -258,31 +170,31 @@ class TelegramVideoConverter:
             transition: all 0.3s;
             backdrop-filter: blur(10px);
             border: 2px solid rgba(255,255,255,0.1);
-        }}
-        .card:hover {{
+        }
+        .card:hover {
             transform: translateY(-10px);
             box-shadow: 0 15px 40px rgba(0,0,0,0.4);
             border-color: rgba(255,255,255,0.3);
-        }}
-        .card-image {{
+        }
+        .card-image {
             width: 100%;
             height: 350px;
             object-fit: cover;
             background: rgba(0,0,0,0.3);
-        }}
-        .card-content {{ padding: 15px; }}
-        .card-title {{ font-size: 1.2rem; font-weight: bold; margin-bottom: 8px; }}
-        .card-genres {{ font-size: 0.85rem; opacity: 0.8; margin-bottom: 10px; }}
-        .card-type {{
+        }
+        .card-content { padding: 15px; }
+        .card-title { font-size: 1.2rem; font-weight: bold; margin-bottom: 8px; }
+        .card-genres { font-size: 0.85rem; opacity: 0.8; margin-bottom: 10px; }
+        .card-type {
             display: inline-block;
             background: rgba(255,255,255,0.2);
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 0.75rem;
             font-weight: 600;
-        }}
+        }
         
-        .modal {{
+        .modal {
             display: none;
             position: fixed;
             top: 0;
@@ -293,24 +205,24 @@ class TelegramVideoConverter:
             z-index: 1000;
             padding: 20px;
             overflow-y: auto;
-        }}
-        .modal.active {{ display: block; }}
-        .modal-content {{
+        }
+        .modal.active { display: block; }
+        .modal-content {
             max-width: 1200px;
             margin: 0 auto;
             background: rgba(255,255,255,0.1);
             border-radius: 20px;
             padding: 30px;
             backdrop-filter: blur(20px);
-        }}
-        .modal-header {{
+        }
+        .modal-header {
             display: flex;
             justify-content: space-between;
             align-items: start;
             margin-bottom: 25px;
-        }}
-        .modal-title {{ font-size: 2rem; font-weight: bold; }}
-        .close-btn {{
+        }
+        .modal-title { font-size: 2rem; font-weight: bold; }
+        .close-btn {
             background: rgba(255,0,0,0.8);
             border: none;
             color: white;
@@ -320,29 +232,29 @@ class TelegramVideoConverter:
             border-radius: 50%;
             cursor: pointer;
             transition: all 0.3s;
-        }}
-        .close-btn:hover {{ background: rgba(255,0,0,1); transform: scale(1.1); }}
+        }
+        .close-btn:hover { background: rgba(255,0,0,1); transform: scale(1.1); }
         
-        .modal-body {{ display: grid; grid-template-columns: 300px 1fr; gap: 30px; }}
-        .modal-image {{
+        .modal-body { display: grid; grid-template-columns: 300px 1fr; gap: 30px; }
+        .modal-image {
             width: 100%;
             border-radius: 15px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.5);
-        }}
-        .modal-info h3 {{ margin-bottom: 15px; font-size: 1.3rem; }}
-        .modal-description {{
+        }
+        .modal-info h3 { margin-bottom: 15px; font-size: 1.3rem; }
+        .modal-description {
             line-height: 1.8;
             margin-bottom: 20px;
             opacity: 0.9;
-        }}
+        }
         
-        .episodes-list {{
+        .episodes-list {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
             gap: 10px;
             margin-top: 20px;
-        }}
-        .episode-btn {{
+        }
+        .episode-btn {
             background: rgba(255,255,255,0.2);
             border: 2px solid rgba(255,255,255,0.3);
             color: white;
@@ -351,24 +263,24 @@ class TelegramVideoConverter:
             cursor: pointer;
             font-weight: 600;
             transition: all 0.3s;
-        }}
-        .episode-btn:hover {{
+        }
+        .episode-btn:hover {
             background: rgba(255,255,255,0.3);
             transform: scale(1.05);
-        }}
+        }
         
-        .video-player {{
+        .video-player {
             width: 100%;
             height: 600px;
             border-radius: 15px;
             margin-top: 20px;
             background: #000;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .modal-body {{ grid-template-columns: 1fr; }}
-            h1 {{ font-size: 2rem; }}
-        }}
+        @media (max-width: 768px) {
+            .modal-body { grid-template-columns: 1fr; }
+            h1 { font-size: 2rem; }
+        }
     </style>
 </head>
 <body>
@@ -414,62 +326,76 @@ class TelegramVideoConverter:
         let animeData = [];
         let moviesData = [];
         
-        async function loadData() {{
-            try {{
+        // anime.json / movies.json store one column per field: an array when every
+        // item has the field, otherwise a sparse {index: value} map
+        function fromColumns(columns) {
+            if (Array.isArray(columns)) return columns;
+            const items = [];
+            for (const [key, cells] of Object.entries(columns || {})) {
+                for (const idx of Object.keys(cells)) {
+                    (items[idx] = items[idx] || {})[key] = cells[idx];
+                }
+            }
+            return items.filter(Boolean);
+        }
+        
+        async function loadData() {
+            try {
                 const animeRes = await fetch('anime.json');
                 const animeJson = await animeRes.json();
-                animeData = animeJson.anime || [];
+                animeData = fromColumns(animeJson.anime);
                 
                 const moviesRes = await fetch('movies.json');
                 const moviesJson = await moviesRes.json();
-                moviesData = moviesJson.movies || [];
+                moviesData = fromColumns(moviesJson.movies);
                 
                 renderAnime();
                 renderMovies();
-            }} catch (error) {{
+            } catch (error) {
                 console.error('Error loading data:', error);
-            }}
-        }}
+            }
+        }
         
-        function renderAnime() {{
+        function renderAnime() {
             const grid = document.getElementById('animeGrid');
-            grid.innerHTML = animeData.map(anime => `
-                <div class="card" onclick='openModal(${{JSON.stringify(anime).replace(/'/g, "&apos;")}}, "anime")'>
-                    <img src="${{anime.image || 'https://via.placeholder.com/250x350/667eea/ffffff?text=' + anime.name}}" 
-                         class="card-image" alt="${{anime.name}}">
+            grid.innerHTML = animeData.map((anime, idx) => `
+                <div class="card" data-idx="${idx}" onclick="openModal(this.dataset.idx, 'anime')">
+                    <img src="${anime.image || 'https://via.placeholder.com/250x350/667eea/ffffff?text=' + anime.name}" 
+                         class="card-image" alt="${anime.name}">
                     <div class="card-content">
-                        <div class="card-title">${{anime.name}}</div>
-                        <div class="card-genres">${{(anime.genre || []).join(', ')}}</div>
-                        <span class="card-type">${{anime.type === 'series' ? '📺 Series' : '🎬 Movie'}}</span>
+                        <div class="card-title">${anime.name}</div>
+                        <div class="card-genres">${(anime.genre || []).join(', ')}</div>
+                        <span class="card-type">${anime.type === 'series' ? '📺 Series' : '🎬 Movie'}</span>
                     </div>
                 </div>
             `).join('');
-        }}
+        }
         
-        function renderMovies() {{
+        function renderMovies() {
             const grid = document.getElementById('moviesGrid');
-            grid.innerHTML = moviesData.map(movie => `
-                <div class="card" onclick='openModal(${{JSON.stringify(movie).replace(/'/g, "&apos;")}}, "movie")'>
-                    <img src="${{movie.image || 'https://via.placeholder.com/250x350/764ba2/ffffff?text=' + movie.name}}" 
-                         class="card-image" alt="${{movie.name}}">
+            grid.innerHTML = moviesData.map((movie, idx) => `
+                <div class="card" data-idx="${idx}" onclick="openModal(this.dataset.idx, 'movie')">
+                    <img src="${movie.image || 'https://via.placeholder.com/250x350/764ba2/ffffff?text=' + movie.name}" 
+                         class="card-image" alt="${movie.name}">
                     <div class="card-content">
-                        <div class="card-title">${{movie.name}}</div>
-                        <div class="card-genres">${{(movie.genre || []).join(', ')}}</div>
+                        <div class="card-title">${movie.name}</div>
+                        <div class="card-genres">${(movie.genre || []).join(', ')}</div>
                         <span class="card-type">🎥 Movie</span>
                     </div>
                 </div>
             `).join('');
-        }}
+        }
         
-        function switchTab(tab) {{
+        function switchTab(tab) {
             document.querySelectorAll('.tab-btn').forEach(btn => btn.classList.remove('active'));
             document.querySelectorAll('.content').forEach(content => content.classList.remove('active'));
             
             event.target.classList.add('active');
             document.getElementById(tab).classList.add('active');
-        }}
+        }
         
-        function openModal(item, type) {{
+        function openModal(idx, type) {
+            const item = (type === 'anime' ? animeData : moviesData)[idx];
             document.getElementById('modalTitle').textContent = item.name;
             document.getElementById('modalImage').src = item.image || '';
             document.getElementById('modalDescription').textContent = item.description || 'No description available.';
@@ -477,51 +403,250 @@ class TelegramVideoConverter:
             const episodesSection = document.getElementById('episodesSection');
             const videoSection = document.getElementById('videoSection');
             
-            if (item.type === 'series' && item.episodes) {{
+            if (item.type === 'series' && item.episodes) {
                 episodesSection.innerHTML = `
                     <h3>📺 Episodes</h3>
                     <div class="episodes-list">
-                        ${{item.episodes.map(ep => `
-                            <button class="episode-btn" onclick='playVideo("${{ep.video_url}}")'>
-                                EP ${{ep.number}}
+                        ${item.episodes.map(ep => `
+                            <button class="episode-btn" onclick='playVideo("${ep.video_url}")'>
+                                EP ${ep.number}
                             </button>
-                        `).join('')}}
+                        `).join('')}
                     </div>
                 `;
                 videoSection.innerHTML = '<iframe id="videoPlayer" class="video-player" allowfullscreen allow="autoplay"></iframe>';
-            }} else if (item.video_url) {{
+            } else if (item.video_url) {
                 episodesSection.innerHTML = '';
                 videoSection.innerHTML = `
-                    <iframe id="videoPlayer" class="video-player" src="${{item.video_url}}" 
+                    <iframe id="videoPlayer" class="video-player" src="${item.video_url}" 
                             allowfullscreen allow="autoplay"></iframe>
                 `;
-            }}
+            }
             
             document.getElementById('modal').classList.add('active');
-        }}
+        }
         
-        function playVideo(url) {{
+        function playVideo(url) {
             document.getElementById('videoPlayer').src = url;
-        }}
+        }
         
-        function closeModal() {{
+        function closeModal() {
             document.getElementById('modal').classList.remove('active');
             const player = document.getElementById('videoPlayer');
             if (player) player.src = '';
-        }}
+        }
         
-        document.addEventListener('keydown', (e) => {{
+        document.addEventListener('keydown', (e) => {
             if (e.key === 'Escape') closeModal();
-        }});
+        });
         
         loadData();
     </script>
 </body>
 </html>'''
+_HTML_TEMPLATE_BYTES = _HTML_TEMPLATE.encode('utf-8')
+
+
+class TelegramVideoConverter:
+    """Convert Telegram video links to embeddable format"""
+    
+    def __init__(self, output_dir='../public', verbose: bool = False):
+        self.output_dir = Path(output_dir)
+        self.verbose = verbose
+        self.output_dir.mkdir(exist_ok=True)
+        self.anime_data = []
+        self.movie_data = []
+        # Shared updated_at value, refreshed at most once per second
+        self._now_iso = ''
+        self._now_checked = float('-inf')
+        # Successful inserts, reported in one summary line instead of per entry
+        self._added_anime = 0
+        self._added_movies = 0
+    
+    def _timestamp(self, refresh: bool = False) -> str:
+        """Current UTC time as a second-precision ISO 8601 string, recomputed at most once per second"""
+        now = time.monotonic()
+        if refresh or now - self._now_checked >= 1.0:
+            self._now_iso = datetime.now(timezone.utc).isoformat(timespec='seconds')
+            self._now_checked = now
+        return self._now_iso
+    
+    def convert_telegram_link(self, tg_link: str) -> Optional[Dict[str, str]]:
+        """
+        Convert Telegram link to usable video URL
+        Supports:
+        - t.me/channel/post
+        - t.me/c/channel/post
+        - Direct video file links
+        """
+        if not tg_link:
+            return None
+        
+        # Clean the link
+        tg_link = tg_link.strip()
+        
+        converted = _convert_link(tg_link)
+        if converted is None:
+            return None
+        
+        original, embed_url, preview_url, link_type = converted
+        return {
+            'original': original,
+            'embed_url': embed_url,
+            'preview_url': preview_url,
+            'type': link_type
+        }
+    
+    def add_anime(self, anime_data: Dict) -> bool:
+        """
+        Add anime entry
+        Expected format:
+        {
+            "id": "one-piece",
+            "name": "One Piece",
+            "image": "https://...",
+            "genre": ["Action", "Adventure"],
+            "description": "...",
+            "type": "series",
+            "episodes": [
+                {
+                    "number": 1,
+                    "title": "Episode 1",
+                    "telegram_link": "t.me/channel/123"
+                }
+            ],
+            "related": {
+                "previous_season": null,
+                "next_season": "one-piece-2"
+            }
+        }
+        """
+        try:
+            # Validate required fields
+            if not _ANIME_REQUIRED.issubset(anime_data):
+                print(f"❌ Missing required fields: {sorted(_ANIME_REQUIRED.difference(anime_data))}")
+                return False
+            
+            # Convert Telegram links for episodes
+            if anime_data.get('type') == 'series' and 'episodes' in anime_data:
+                convert = self.convert_telegram_link
+                for episode in anime_data['episodes']:
+                    if (link := episode.get('telegram_link')) and (converted := convert(link)):
+                        episode['video_url'] = converted['embed_url']
+                        episode['video_type'] = converted['type']
+            elif anime_data.get('type') == 'standalone' and 'telegram_link' in anime_data:
+                converted = self.convert_telegram_link(anime_data['telegram_link'])
+                if converted:
+                    anime_data['video_url'] = converted['embed_url']
+                    anime_data['video_type'] = converted['type']
+            
+            _intern_tags(anime_data)
+            anime_data['updated_at'] = self._timestamp()
+            self.anime_data.append(anime_data)
+            self._added_anime += 1
+            if self.verbose:
+                print(f"✅ Added anime: {anime_data['name']}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error adding anime: {e}")
+            return False
+    
+    def add_movie(self, movie_data: Dict) -> bool:
+        """
+        Add movie entry
+        Expected format:
+        {
+            "id": "inception",
+            "name": "Inception",
+            "image": "https://...",
+            "genre": ["Sci-Fi", "Thriller"],
+            "description": "...",
+            "type": "standalone",
+            "telegram_link": "t.me/channel/456"
+        }
+        """
+        try:
+            if not _MOVIE_REQUIRED.issubset(movie_data):
+                print(f"❌ Missing required fields: {sorted(_MOVIE_REQUIRED.difference(movie_data))}")
+                return False
+            
+            # Convert Telegram link
+            converted = self.convert_telegram_link(movie_data['telegram_link'])
+            if converted:
+                movie_data['video_url'] = converted['embed_url']
+                movie_data['video_type'] = converted['type']
+            else:
+                print(f"⚠️  Could not convert Telegram link for {movie_data['name']}")
+            
+            _intern_tags(movie_data)
+            movie_data['updated_at'] = self._timestamp()
+            self.movie_data.append(movie_data)
+            self._added_movies += 1
+            if self.verbose:
+                print(f"✅ Added movie: {movie_data['name']}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error adding movie: {e}")
+            return False
+    
+    def load_from_json(self, anime_file: str = None, movie_file: str = None):
+        """Load existing anime and movie data from JSON files"""
+        self._timestamp(refresh=True)
+        added_anime, added_movies = self._added_anime, self._added_movies
+        
+        sources = ((anime_file, 'anime', self.add_anime), (movie_file, 'movies', self.add_movie))
+        for path, key, add in sources:
+            if not path:
+                continue
+            
+            # Missing files are skipped; opening directly avoids a separate stat
+            try:
+                data = _load_json(path)
+            except FileNotFoundError:
+                continue
+            
+            entries = _from_columns(data.get(key))
+            for entry in entries:
+                add(entry)
+        
+        print(f"✅ Loaded {self._added_anime - added_anime} anime and "
+              f"{self._added_movies - added_movies} movies")
+    
+    def save_outputs(self):
+        """Save anime and movie JSON files"""
+        now = self._timestamp(refresh=True)
+        
+        # The three files are independent, so overlap their writes
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self._write_json, self.output_dir / 'anime.json', {
+                    'last_updated': now,
+                    'total_anime': len(self.anime_data),
+                    'anime': _to_columns(self.anime_data)
+                }),
+                executor.submit(self._write_json, self.output_dir / 'movies.json', {
+                    'last_updated': now,
+                    'total_movies': len(self.movie_data),
+                    'movies': _to_columns(self.movie_data)
+                }),
+                executor.submit(self.generate_web_interface),
+            ]
+            for future in futures:
+                future.result()
         
+        print(f"\n✅ Saved {len(self.anime_data)} anime and {len(self.movie_data)} movies")
+        print(f"📁 Output directory: {self.output_dir.absolute()}")
+    
+    def _write_json(self, path: Path, payload: Dict):
+        """Serialize payload to path as compact JSON"""
+        path.write_bytes(_json_bytes(payload))
+    
+    def generate_web_interface(self):
+        """Generate modern web interface for anime and movies"""
         html_path = self.output_dir / 'videos.html'
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_path.write_bytes(_HTML_TEMPLATE_BYTES)
 
 
 # Example usage